@@ -27,9 +27,82 @@ These can be installed via pip if not already available:
 """
 
 import sys
+from dataclasses import dataclass
 from pathlib import Path
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+
+# Severity labels in display order; used as a categorical dtype so that every
+# summary has all three columns even when a severity never occurs.
+SEVERITIES = ["low", "medium", "high"]
+SEVERITY_DTYPE = pd.CategoricalDtype(SEVERITIES, ordered=True)
+
+# Charts of wide event type taxonomies only label every n-th bar, since
+# drawing hundreds of rotated tick labels dominates rendering time.
+MAX_XTICKS = 30
+
+# Taxonomies with more event types than this only list the TOP_EVENT_TYPES
+# largest totals instead of ranking every type.
+FULL_RANKING_MAX = 50
+TOP_EVENT_TYPES = 10
+
+# Only these columns are parsed from the input; free-text columns such as
+# ``description`` are skipped by the CSV reader.
+EVENT_COLUMNS = ["timestamp", "event_type", "severity"]
+REQUIRED_COLUMNS = set(EVENT_COLUMNS)
+# Low-cardinality string columns are parsed straight into categoricals rather
+# than one Python string object per row.
+CSV_DTYPES = {"event_type": "category", "severity": "category"}
+
+
+@dataclass(frozen=True)
+class SummaryResult:
+    """Incident counts per event type and severity.
+
+    ``counts[i, j]`` is the number of events of type ``labels[i]`` whose
+    severity is ``SEVERITIES[j]``.  Plotting and printing only need these
+    arrays, so a DataFrame is built only when ``to_frame`` is called.
+    """
+
+    labels: np.ndarray
+    counts: np.ndarray
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the counts as a DataFrame with one column per severity."""
+        return pd.DataFrame(self.counts,
+                            index=pd.Index(self.labels, name="event_type"),
+                            columns=pd.Index(SEVERITIES, name="severity"))
+
+
+def _as_severity(severity: pd.Series) -> pd.Series:
+    """Return ``severity`` as a lower-cased ``SEVERITY_DTYPE`` categorical.
+
+    Only the (few) distinct labels are lower-cased, not every row.  Labels
+    outside low/medium/high become missing values.
+    """
+    if severity.dtype == SEVERITY_DTYPE:
+        return severity
+    if not isinstance(severity.dtype, pd.CategoricalDtype):
+        severity = severity.astype("category")
+    labels = severity.cat.categories.map(lambda label: str(label).lower())
+    # Old code -> new code; the trailing -1 keeps missing values (code -1) missing
+    lookup = np.append(SEVERITY_DTYPE.categories.get_indexer(labels), -1)
+    codes = lookup[severity.cat.codes.to_numpy()]
+    return pd.Series(pd.Categorical.from_codes(codes, dtype=SEVERITY_DTYPE),
+                     index=severity.index, name=severity.name)
+
+
+def _columns_to_read(csv_path: Path) -> list[str]:
+    """Return the dashboard columns present in the header of ``csv_path``.
+
+    Only the header row is parsed, so a file missing a required column is
+    rejected before any of its rows are read.
+    """
+    header = set(pd.read_csv(csv_path, nrows=0).columns)
+    missing = REQUIRED_COLUMNS - header
+    if missing:
+        raise ValueError(f"Missing required columns in input CSV: {missing}")
+    return [col for col in EVENT_COLUMNS if col in header]
 
 
 def load_events(csv_path: Path) -> pd.DataFrame:
@@ -56,17 +129,30 @@ def load_events(csv_path: Path) -> pd.DataFrame:
     """
     if not csv_path.exists():
         raise FileNotFoundError(f"Input CSV does not exist: {csv_path}")
-    df = pd.read_csv(csv_path)
-    required_cols = {"timestamp", "event_type", "severity"}
-    missing = required_cols - set(df.columns)
-    if missing:
-        raise ValueError(f"Missing required columns in input CSV: {missing}")
+    df = pd.read_csv(csv_path, usecols=_columns_to_read(csv_path), dtype=CSV_DTYPES)
     # Parse timestamps; errors='coerce' will convert invalid dates to NaT
     df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
+    df["severity"] = _as_severity(df["severity"])
     return df
 
 
-def generate_summary(df: pd.DataFrame) -> pd.DataFrame:
+def _count_by_severity(label_codes: np.ndarray, n_labels: int,
+                       severity: pd.Series) -> np.ndarray:
+    """Count rows per (label, severity) pair as an ``(n_labels, 3)`` array.
+
+    Every pair maps to its own bin of a flat array, so all pairs are counted
+    in a single ``bincount`` pass.  Rows with a missing label (code -1) or an
+    unknown severity are skipped.
+    """
+    severity_codes = _as_severity(severity).cat.codes.to_numpy()
+    valid = (label_codes >= 0) & (severity_codes >= 0)
+    n_severities = len(SEVERITIES)
+    bins = label_codes[valid].astype(np.int64) * n_severities + severity_codes[valid]
+    counts = np.bincount(bins, minlength=n_labels * n_severities)
+    return counts.reshape(n_labels, n_severities)
+
+
+def generate_summary(df: pd.DataFrame) -> SummaryResult:
     """
     Create a summary table counting incidents by type and severity.
 
@@ -77,53 +163,79 @@ def generate_summary(df: pd.DataFrame) -> pd.DataFrame:
 
     Returns
     -------
-    pandas.DataFrame
-        A pivot table where rows are event types, columns are severity
-        categories (low/medium/high) and values are counts.  Missing
-        combinations are filled with zeroes.
+    SummaryResult
+        Event types as ``labels`` and an array of counts with one column per
+        severity category (low/medium/high).  Missing combinations are
+        filled with zeroes.
     """
-    summary = df.pivot_table(index="event_type",
-                             columns="severity",
-                             values="timestamp",
-                             aggfunc="count",
-                             fill_value=0)
-    # Ensure consistent column order and include missing severities
-    severities = ["low", "medium", "high"]
-    for sev in severities:
-        if sev not in summary.columns:
-            summary[sev] = 0
-    summary = summary[severities]
-    return summary
-
-
-def plot_summary(summary: pd.DataFrame, output_path: Path) -> None:
+    event_type = df["event_type"]
+    if not isinstance(event_type.dtype, pd.CategoricalDtype):
+        event_type = event_type.astype("category")
+    categories = event_type.cat.categories
+    counts = _count_by_severity(event_type.cat.codes.to_numpy(), len(categories), df["severity"])
+    return SummaryResult(categories.to_numpy(), counts)
+
+
+def plot_summary(summary: SummaryResult, output_path: Path) -> None:
     """Plot a grouped bar chart of the summary and save to output_path."""
-    plt.figure(figsize=(10, 6))
+    # matplotlib is imported on first use, so a usage or input error exits
+    # without paying for it.  The figure is built directly rather than
+    # through pyplot: the chart is only written to a file, so neither a GUI
+    # backend nor pyplot's global figure registry is needed.
+    from matplotlib.collections import PolyCollection
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(10, 6))
+    ax = fig.add_subplot()
     # Generate bar positions
-    import numpy as np
-    x = np.arange(len(summary.index))
+    x = np.arange(len(summary.labels))
+    values = summary.counts
     width = 0.25
-    for i, sev in enumerate(summary.columns):
-        plt.bar(x + i * width - width, summary[sev], width=width, label=sev.capitalize())
-    plt.xticks(x, summary.index, rotation=30, ha='right')
-    plt.ylabel("Number of events")
-    plt.title("Incident Summary by Type and Severity")
-    plt.legend(title="Severity")
-    plt.tight_layout()
-    plt.savefig(output_path)
-    plt.close()
-
-
-def print_summary(summary: pd.DataFrame) -> None:
+    many_bars = len(x) > MAX_XTICKS
+    for i, sev in enumerate(SEVERITIES):
+        # One collection per severity rather than a Rectangle artist per bar;
+        # vertices run (left, 0) -> (left, h) -> (right, h) -> (right, 0).
+        left = x + (i - 1) * width - width / 2
+        verts = np.empty((len(x), 4, 2))
+        verts[:, :, 0] = left[:, None] + np.array([0, 0, width, width])
+        verts[:, :, 1] = values[:, i, None] * np.array([0, 1, 1, 0])
+        bars = PolyCollection(verts, facecolors=f"C{i}", label=sev.capitalize(),
+                              rasterized=many_bars)
+        bars.sticky_edges.y.append(0)
+        ax.add_collection(bars)
+    ax.autoscale_view()
+    step = -(-len(x) // MAX_XTICKS) if many_bars else 1
+    ax.set_xticks(x[::step])
+    ax.set_xticklabels(summary.labels[::step], rotation=30, ha='right')
+    ax.set_ylabel("Number of events")
+    ax.set_title("Incident Summary by Type and Severity")
+    ax.legend(title="Severity")
+    fig.tight_layout()
+    fig.savefig(output_path)
+
+
+def print_summary(summary: SummaryResult) -> None:
     """Print a human‑readable summary to stdout."""
     print("Incident counts by type and severity:")
-    print(summary.to_string())
+    print(summary.to_frame().to_string())
     print()
     # Top offenders by count across all severities
-    totals = summary.sum(axis=1).sort_values(ascending=False)
-    print("Top event types by total count:")
-    for event_type, count in totals.items():
-        print(f"  {event_type}: {count}")
+    totals = summary.counts.sum(axis=1)
+    if len(totals) > FULL_RANKING_MAX:
+        # Partition out the k largest totals rather than sorting them all.
+        # Every type tied with the k-th total is kept as a candidate so the
+        # stable sort breaks ties by position, as in the full ranking.
+        k = TOP_EVENT_TYPES
+        kth_total = totals[np.argpartition(-totals, k - 1)[k - 1]]
+        candidates = np.flatnonzero(totals >= kth_total)
+        order = candidates[np.argsort(-totals[candidates], kind="stable")[:k]]
+        lines = [f"Top {k} of {len(totals)} event types by total count:"]
+    else:
+        order = np.argsort(-totals, kind="stable")
+        lines = ["Top event types by total count:"]
+    event_types = summary.labels
+    lines.extend(f"  {event_types[i]}: {totals[i]}" for i in order)
+    print("\n".join(lines))
 
 
 def main() -> None:
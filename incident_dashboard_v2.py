@@ -15,89 +15,291 @@ Usage:
 import sys
 from pathlib import Path
 import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+
+SEVERITIES = ["low", "medium", "high"]
+SEVERITY_DTYPE = pd.CategoricalDtype(SEVERITIES, ordered=True)
+HIGH_CODE = SEVERITIES.index("high")
+
+# Wider charts (e.g. a year of daily counts) only label every n-th bar, since
+# drawing hundreds of rotated tick labels dominates rendering time.
+MAX_XTICKS = 30
+
+# Taxonomies with more event types than this only list the TOP_EVENT_TYPES
+# largest totals instead of ranking every type.
+FULL_RANKING_MAX = 50
+TOP_EVENT_TYPES = 10
+
+# Only these columns are parsed from the input; free-text columns such as
+# ``description`` are skipped by the CSV reader.
+EVENT_COLUMNS = ["timestamp", "event_type", "severity", "ip"]
+REQUIRED_COLUMNS = {"timestamp", "event_type", "severity"}
+# Low-cardinality string columns are parsed straight into categoricals rather
+# than one Python string object per row.
+CSV_DTYPES = {"event_type": "category", "severity": "category", "ip": "category"}
+
+
+@dataclass(frozen=True)
+class SummaryResult:
+    """Incident counts per label (event type or date) and severity.
+
+    ``counts[i, j]`` is the number of events for ``labels[i]`` whose severity
+    is ``SEVERITIES[j]``.  Plotting and printing only need these arrays, so a
+    DataFrame is built only when ``to_frame`` is called.
+    """
+
+    labels: np.ndarray
+    counts: np.ndarray
+    label_name: str = "event_type"
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the counts as a DataFrame with one column per severity."""
+        return pd.DataFrame(self.counts,
+                            index=pd.Index(self.labels, name=self.label_name),
+                            columns=pd.Index(SEVERITIES, name="severity"))
+
+
+def _as_severity(severity: pd.Series) -> pd.Series:
+    """Return ``severity`` as a lower-cased ``SEVERITY_DTYPE`` categorical.
+
+    Only the (few) distinct labels are lower-cased, not every row.  Labels
+    outside low/medium/high become missing values.
+    """
+    if severity.dtype == SEVERITY_DTYPE:
+        return severity
+    if not isinstance(severity.dtype, pd.CategoricalDtype):
+        severity = severity.astype("category")
+    labels = severity.cat.categories.map(lambda label: str(label).lower())
+    # Old code -> new code; the trailing -1 keeps missing values (code -1) missing
+    lookup = np.append(SEVERITY_DTYPE.categories.get_indexer(labels), -1)
+    codes = lookup[severity.cat.codes.to_numpy()]
+    return pd.Series(pd.Categorical.from_codes(codes, dtype=SEVERITY_DTYPE),
+                     index=severity.index, name=severity.name)
+
+
+def _columns_to_read(csv_path: Path) -> list[str]:
+    """Return the dashboard columns present in the header of ``csv_path``.
+
+    Only the header row is parsed, so a file missing a required column is
+    rejected before any of its rows are read.
+    """
+    header = set(pd.read_csv(csv_path, nrows=0).columns)
+    missing = REQUIRED_COLUMNS - header
+    if missing:
+        raise ValueError(f"Missing required columns in input CSV: {missing}")
+    return [col for col in EVENT_COLUMNS if col in header]
+
+
+def _high_mask(df: pd.DataFrame) -> np.ndarray:
+    """Return a boolean mask selecting the high severity rows of ``df``.
+
+    ``load_events`` stores this mask as the ``is_high`` column so that it is
+    computed once per input (and cached with it); other frames fall back to
+    comparing severity codes.
+    """
+    if "is_high" in df.columns:
+        return df["is_high"].to_numpy()
+    return _as_severity(df["severity"]).cat.codes.to_numpy() == HIGH_CODE
 
 
 def load_events(csv_path: Path) -> pd.DataFrame:
-    """Load the event log CSV into a Pandas DataFrame with parsed timestamps."""
+    """Load the event log CSV into a Pandas DataFrame with parsed timestamps.
+
+    The parsed events are cached next to the CSV as ``<name>.parquet`` (when a
+    Parquet engine such as pyarrow is installed) and reused on later runs for
+    as long as the cache is newer than the CSV.
+    """
     if not csv_path.exists():
         raise FileNotFoundError(f"Input CSV does not exist: {csv_path}")
-    df = pd.read_csv(csv_path)
-    required_cols = {"timestamp", "event_type", "severity"}
-    missing = required_cols - set(df.columns)
-    if missing:
-        raise ValueError(f"Missing required columns in input CSV: {missing}")
+    cached = _read_cache(csv_path)
+    if cached is not None:
+        return cached
+    df = pd.read_csv(csv_path, usecols=_columns_to_read(csv_path), dtype=CSV_DTYPES)
     df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
+    df["severity"] = _as_severity(df["severity"])
+    df["is_high"] = _high_mask(df)
+    _write_cache(df, csv_path)
     return df
 
 
-def generate_summary(df: pd.DataFrame) -> pd.DataFrame:
-    """Return a pivot table counting events by type and severity."""
-    summary = df.pivot_table(index="event_type",
-                             columns="severity",
-                             values="timestamp",
-                             aggfunc="count",
-                             fill_value=0)
-    severities = ["low", "medium", "high"]
-    for sev in severities:
-        if sev not in summary.columns:
-            summary[sev] = 0
-    return summary[severities]
+def _cache_path(csv_path: Path) -> Path:
+    """Return the Parquet sidecar used to cache the parsed ``csv_path``."""
+    return csv_path.with_name(csv_path.name + ".parquet")
+
+
+def _read_cache(csv_path: Path) -> Optional[pd.DataFrame]:
+    """Return the cached events for ``csv_path`` if the cache is up to date."""
+    cache = _cache_path(csv_path)
+    if not cache.exists() or cache.stat().st_mtime < csv_path.stat().st_mtime:
+        return None
+    try:
+        return pd.read_parquet(cache)
+    except Exception:
+        # Missing Parquet engine or an unreadable cache: fall back to the CSV
+        return None
+
+
+def _write_cache(df: pd.DataFrame, csv_path: Path) -> None:
+    """Cache parsed events next to ``csv_path``; caching is best effort."""
+    try:
+        df.to_parquet(_cache_path(csv_path), compression="zstd")
+    except Exception as exc:
+        logging.debug(f"Not caching parsed events: {exc}")
+
+
+def _count_by_severity(label_codes: np.ndarray, n_labels: int,
+                       severity: pd.Series) -> np.ndarray:
+    """Count rows per (label, severity) pair as an ``(n_labels, 3)`` array.
+
+    Every pair maps to its own bin of a flat array, so all pairs are counted
+    in a single ``bincount`` pass.  Rows with a missing label (code -1) or an
+    unknown severity are skipped.
+    """
+    severity_codes = _as_severity(severity).cat.codes.to_numpy()
+    valid = (label_codes >= 0) & (severity_codes >= 0)
+    n_severities = len(SEVERITIES)
+    bins = label_codes[valid].astype(np.int64) * n_severities + severity_codes[valid]
+    counts = np.bincount(bins, minlength=n_labels * n_severities)
+    return counts.reshape(n_labels, n_severities)
 
 
-def compute_daily_summary(df: pd.DataFrame) -> pd.DataFrame:
+def generate_summary(df: pd.DataFrame) -> SummaryResult:
+    """Return counts of events by type and severity."""
+    event_type = df["event_type"]
+    if not isinstance(event_type.dtype, pd.CategoricalDtype):
+        event_type = event_type.astype("category")
+    categories = event_type.cat.categories
+    counts = _count_by_severity(event_type.cat.codes.to_numpy(), len(categories), df["severity"])
+    return SummaryResult(categories.to_numpy(), counts)
+
+
+def compute_daily_summary(df: pd.DataFrame) -> SummaryResult:
     """Aggregate events by calendar date and severity."""
     if "timestamp" not in df.columns:
         raise ValueError("DataFrame must contain a 'timestamp' column")
-    df = df.copy()
-    df["date"] = df["timestamp"].dt.date
-    daily = df.pivot_table(index="date",
-                           columns="severity",
-                           values="timestamp",
-                           aggfunc="count",
-                           fill_value=0)
-    severities = ["low", "medium", "high"]
-    for sev in severities:
-        if sev not in daily.columns:
-            daily[sev] = 0
-    return daily[severities]
+    date_codes, dates = pd.factorize(df["timestamp"].dt.floor("D"), sort=True)
+    counts = _count_by_severity(date_codes, len(dates), df["severity"])
+    return SummaryResult(dates.strftime("%Y-%m-%d").to_numpy(), counts, label_name="date")
+
+
+def generate_summaries(df: pd.DataFrame) -> tuple[SummaryResult, SummaryResult]:
+    """Return ``(generate_summary(df), compute_daily_summary(df))`` in one pass.
+
+    Every row is counted once into a dense (event type, day, severity) array,
+    and both summaries are its sums over days and over event types.  Rows
+    with a missing type or day get an extra slot so that each summary still
+    counts them exactly as the single-purpose functions do.  When that array
+    would be larger than the data itself, the two summaries are computed
+    separately instead.
+    """
+    if "timestamp" not in df.columns:
+        raise ValueError("DataFrame must contain a 'timestamp' column")
+    event_type = df["event_type"]
+    if not isinstance(event_type.dtype, pd.CategoricalDtype):
+        event_type = event_type.astype("category")
+    day_codes, days = pd.factorize(df["timestamp"].dt.floor("D"), sort=True)
+    n_types, n_days = len(event_type.cat.categories), len(days)
+    if (n_types + 1) * (n_days + 1) > len(df):
+        return generate_summary(df), compute_daily_summary(df)
+    event_codes = event_type.cat.codes.to_numpy().astype(np.int64)
+    event_codes[event_codes < 0] = n_types
+    day_codes = np.where(day_codes < 0, n_days, day_codes)
+    counts = _count_by_severity(event_codes * (n_days + 1) + day_codes,
+                                (n_types + 1) * (n_days + 1), df["severity"])
+    counts = counts.reshape(n_types + 1, n_days + 1, len(SEVERITIES))
+    type_counts = counts[:n_types].sum(axis=1)
+    day_counts = counts[:, :n_days].sum(axis=0)
+    return (SummaryResult(event_type.cat.categories.to_numpy(), type_counts),
+            SummaryResult(days.strftime("%Y-%m-%d").to_numpy(), day_counts, label_name="date"))
 
 
 def top_high_severity_ips(df: pd.DataFrame, top_n: int = 5) -> pd.Series:
     """Return the top IP addresses among high severity events."""
     if "severity" not in df.columns or "ip" not in df.columns:
         raise ValueError("DataFrame must contain 'severity' and 'ip' columns")
-    high_df = df[df["severity"].str.lower() == "high"]
-    return high_df["ip"].value_counts().head(top_n)
+    high_df = df[_high_mask(df)]
+    ips = high_df["ip"]
+    if not isinstance(ips.dtype, pd.CategoricalDtype):
+        # Sorted categories, as read_csv gives, so ties break the same way
+        ips = ips.astype("category")
+    # Count per category code and partially sort: only the top_n IPs are
+    # ordered, not every distinct IP.
+    codes = ips.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(ips.cat.categories))
+    k = min(top_n, np.count_nonzero(counts))
+    if k <= 0:
+        return pd.Series([], index=pd.Index([], name="ip"), name="count", dtype="int64")
+    # Ties are broken by category order so the selection is deterministic
+    rank = counts * len(counts) - np.arange(len(counts))
+    top = np.argpartition(-rank, k - 1)[:k]
+    top = top[np.argsort(-rank[top])]
+    return pd.Series(counts[top], index=pd.Index(ips.cat.categories[top], name="ip"), name="count")
+
 
+def plot_summary(summary: SummaryResult, output_path: Path, title: str) -> None:
+    """Render a grouped bar chart for the given summary."""
+    # matplotlib is imported on first use so that --help, input errors and
+    # table-only runs don't pay for it.  Figures are built directly rather
+    # than through pyplot: charts are only written to files (no GUI backend
+    # is needed) and pyplot's global figure registry is not thread-safe.
+    from matplotlib.collections import PolyCollection
+    from matplotlib.figure import Figure
 
-def plot_summary(summary: pd.DataFrame, output_path: Path, title: str) -> None:
-    """Render a grouped bar chart for the given summary DataFrame."""
-    plt.figure(figsize=(10, 6))
-    import numpy as np
-    x = np.arange(len(summary.index))
+    fig = Figure(figsize=(10, 6))
+    ax = fig.add_subplot()
+    # Generate bar positions
+    x = np.arange(len(summary.labels))
+    values = summary.counts
     width = 0.25
-    for i, sev in enumerate(summary.columns):
-        plt.bar(x + i * width - width, summary[sev], width=width, label=sev.capitalize())
-    plt.xticks(x, summary.index, rotation=30, ha='right')
-    plt.ylabel("Number of events")
-    plt.title(title)
-    plt.legend(title="Severity")
-    plt.tight_layout()
-    plt.savefig(output_path)
-    plt.close()
-
-
-def print_summary(summary: pd.DataFrame) -> None:
+    many_bars = len(x) > MAX_XTICKS
+    for i, sev in enumerate(SEVERITIES):
+        # One collection per severity rather than a Rectangle artist per bar;
+        # vertices run (left, 0) -> (left, h) -> (right, h) -> (right, 0).
+        left = x + (i - 1) * width - width / 2
+        verts = np.empty((len(x), 4, 2))
+        verts[:, :, 0] = left[:, None] + np.array([0, 0, width, width])
+        verts[:, :, 1] = values[:, i, None] * np.array([0, 1, 1, 0])
+        bars = PolyCollection(verts, facecolors=f"C{i}", label=sev.capitalize(),
+                              rasterized=many_bars)
+        bars.sticky_edges.y.append(0)
+        ax.add_collection(bars)
+    ax.autoscale_view()
+    step = -(-len(x) // MAX_XTICKS) if many_bars else 1
+    ax.set_xticks(x[::step])
+    ax.set_xticklabels(summary.labels[::step].astype(str), rotation=30, ha='right')
+    ax.set_ylabel("Number of events")
+    ax.set_title(title)
+    ax.legend(title="Severity")
+    fig.tight_layout()
+    fig.savefig(output_path)
+
+
+def print_summary(summary: SummaryResult) -> None:
     """Print a table of counts by type and severity along with totals."""
     print("Incident counts by type and severity:")
-    print(summary.to_string())
+    print(summary.to_frame().to_string())
     print()
-    totals = summary.sum(axis=1).sort_values(ascending=False)
-    print("Top event types by total count:")
-    for event_type, count in totals.items():
-        print(f"  {event_type}: {count}")
+    totals = summary.counts.sum(axis=1)
+    if len(totals) > FULL_RANKING_MAX:
+        # Partition out the k largest totals rather than sorting them all.
+        # Every type tied with the k-th total is kept as a candidate so the
+        # stable sort breaks ties by position, as in the full ranking.
+        k = TOP_EVENT_TYPES
+        kth_total = totals[np.argpartition(-totals, k - 1)[k - 1]]
+        candidates = np.flatnonzero(totals >= kth_total)
+        order = candidates[np.argsort(-totals[candidates], kind="stable")[:k]]
+        lines = [f"Top {k} of {len(totals)} event types by total count:"]
+    else:
+        order = np.argsort(-totals, kind="stable")
+        lines = ["Top event types by total count:"]
+    event_types = summary.labels
+    lines.extend(f"  {event_types[i]}: {totals[i]}" for i in order)
+    print("\n".join(lines))
 
 
 def parse_args(args: list[str]) -> argparse.Namespace:
@@ -120,22 +322,35 @@ def parse_args(args: list[str]) -> argparse.Namespace:
 def main() -> None:
     args = parse_args(sys.argv[1:])
     df = load_events(args.input_csv)
-    # Summary by type/severity
-    summary = generate_summary(df)
-    print_summary(summary)
-    plot_summary(summary, args.output_png, title="Incident Summary by Type and Severity")
-    print(f"Summary chart saved to {args.output_png}")
-    # Optional daily summary
-    if args.daily_output:
-        daily = compute_daily_summary(df)
-        plot_summary(daily, args.daily_output, title="Daily Incident Counts by Severity")
-        print(f"Daily summary chart saved to {args.daily_output}")
-    # Optional high severity IP list
-    if args.top_high > 0:
-        ips = top_high_severity_ips(df, args.top_high)
-        print(f"Top {args.top_high} IP addresses with high severity events:")
-        for ip, count in ips.items():
-            print(f"  {ip}: {count}")
+    # The count tables are built first; the charts then render on worker
+    # threads (PNG encoding releases the GIL) alongside each other and the
+    # top IP list.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # Summary by type/severity, counted together with the daily summary
+        # when that is requested too
+        if args.daily_output:
+            summary, daily = generate_summaries(df)
+        else:
+            summary = generate_summary(df)
+        print_summary(summary)
+        summary_plot = executor.submit(plot_summary, summary, args.output_png,
+                                       title="Incident Summary by Type and Severity")
+        # Optional daily summary
+        daily_plot = None
+        if args.daily_output:
+            daily_plot = executor.submit(plot_summary, daily, args.daily_output,
+                                         title="Daily Incident Counts by Severity")
+        # Optional high severity IP list
+        if args.top_high > 0:
+            ips = top_high_severity_ips(df, args.top_high)
+            print(f"Top {args.top_high} IP addresses with high severity events:")
+            for ip, count in ips.items():
+                print(f"  {ip}: {count}")
+        summary_plot.result()
+        print(f"Summary chart saved to {args.output_png}")
+        if daily_plot is not None:
+            daily_plot.result()
+            print(f"Daily summary chart saved to {args.daily_output}")
 
 
 if __name__ == "__main__":
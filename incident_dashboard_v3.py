@@ -31,27 +31,96 @@ You can pipe data from another process using ``-`` as the input filename:
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import Future, ThreadPoolExecutor
 import logging
 import sys
 from pathlib import Path
-from typing import Dict, Iterable, Optional
+from typing import Callable, Dict, Optional
 
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-
+from pandas.tseries.api import guess_datetime_format
+
+SEVERITIES = ["low", "medium", "high"]
+SEVERITY_DTYPE = pd.CategoricalDtype(SEVERITIES, ordered=True)
+HIGH_CODE = SEVERITIES.index("high")
+
+# Wider charts (e.g. a year of daily counts) only label every n-th bar, since
+# drawing hundreds of rotated tick labels dominates rendering time.
+MAX_XTICKS = 30
+
+# Only these columns are parsed from the input; free-text columns such as
+# ``description`` are skipped by the CSV reader.
+EVENT_COLUMNS = ["timestamp", "event_type", "severity", "ip"]
+REQUIRED_COLUMNS = {"timestamp", "event_type", "severity"}
+# Low-cardinality string columns are parsed straight into categoricals rather
+# than one Python string object per row.
+CSV_DTYPES = {"event_type": "category", "severity": "category", "ip": "category"}
+# Placeholders pandas skips when it guesses the format of a timestamp column
+TIMESTAMP_PLACEHOLDERS = {"", "NaT", "nat", "NAT", "nan", "NaN", "NAN", "now", "today"}
 
 # Configure a basic logger for debugging and informational messages
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
 
+def _as_severity(severity: pd.Series) -> pd.Series:
+    """Return ``severity`` as a lower-cased ``SEVERITY_DTYPE`` categorical.
+
+    Only the (few) distinct labels are lower-cased, not every row.  Labels
+    outside low/medium/high become missing values.
+    """
+    if severity.dtype == SEVERITY_DTYPE:
+        return severity
+    if not isinstance(severity.dtype, pd.CategoricalDtype):
+        severity = severity.astype("category")
+    labels = severity.cat.categories.map(lambda label: str(label).lower())
+    # Old code -> new code; the trailing -1 keeps missing values (code -1) missing
+    lookup = np.append(SEVERITY_DTYPE.categories.get_indexer(labels), -1)
+    codes = lookup[severity.cat.codes.to_numpy()]
+    return pd.Series(pd.Categorical.from_codes(codes, dtype=SEVERITY_DTYPE),
+                     index=severity.index, name=severity.name)
+
+
+def _is_event_column(col: str) -> bool:
+    """Column filter for STDIN input, whose header cannot be read ahead."""
+    return col in EVENT_COLUMNS
+
+
+def _columns_to_read(csv_path: Path) -> list[str]:
+    """Return the dashboard columns present in the header of ``csv_path``.
+
+    Only the header row is parsed, so a file missing a required column is
+    rejected before any of its rows are read.
+    """
+    header = set(pd.read_csv(csv_path, nrows=0).columns)
+    missing = REQUIRED_COLUMNS - header
+    if missing:
+        raise ValueError(f"Missing required columns in input CSV: {missing}")
+    return [col for col in EVENT_COLUMNS if col in header]
+
+
+def _high_mask(df: pd.DataFrame) -> np.ndarray:
+    """Return a boolean mask selecting the high severity rows of ``df``.
+
+    ``load_events`` stores this mask as the ``is_high`` column so that it is
+    computed once per input (and cached with it); other frames fall back to
+    comparing severity codes.
+    """
+    if "is_high" in df.columns:
+        return df["is_high"].to_numpy()
+    return _as_severity(df["severity"]).cat.codes.to_numpy() == HIGH_CODE
+
 
 def load_events(source: str | Path) -> pd.DataFrame:
     """Load incident events from a CSV file path or from STDIN.
 
     The input can be a filename, a Path object or the special string "-" to
     indicate that CSV data should be read from standard input.  All timestamps
-    are parsed into pandas ``datetime`` objects.  The DataFrame is returned
-    unchanged except for the required ``timestamp`` conversion and validation.
+    are parsed into pandas ``datetime`` objects.  Only the columns used by the
+    dashboard are loaded, with ``event_type`` and ``severity`` parsed as
+    categoricals.  Events parsed from a file are cached next to it as
+    ``<name>.parquet`` (when a Parquet engine such as pyarrow is installed)
+    and reused for as long as the cache is newer than the CSV.
 
     Parameters
     ----------
@@ -70,41 +139,88 @@ def load_events(source: str | Path) -> pd.DataFrame:
     ValueError
         If the required columns are missing from the CSV.
     """
+    csv_path = None
     if source == "-":
         logging.info("Reading event data from STDIN…")
-        df = pd.read_csv(sys.stdin)
+        df = pd.read_csv(sys.stdin, usecols=_is_event_column, dtype=CSV_DTYPES)
     else:
         csv_path = Path(source)
         if not csv_path.exists():
             raise FileNotFoundError(f"Input CSV does not exist: {csv_path}")
-        df = pd.read_csv(csv_path)
+        cached = _read_cache(csv_path)
+        if cached is not None:
+            logging.info(f"Using cached events from {_cache_path(csv_path)}")
+            return cached
+        df = pd.read_csv(csv_path, usecols=_columns_to_read(csv_path), dtype=CSV_DTYPES)
 
-    required_cols = {"timestamp", "event_type", "severity"}
-    missing = required_cols - set(df.columns)
+    missing = REQUIRED_COLUMNS - set(df.columns)
     if missing:
         raise ValueError(f"Missing required columns in input CSV: {missing}")
     # parse timestamps; coerce errors to NaT so they can be detected
     df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
+    df["severity"] = _as_severity(df["severity"])
+    df["is_high"] = _high_mask(df)
+    if csv_path is not None:
+        _write_cache(df, csv_path)
     return df
 
 
+def _cache_path(csv_path: Path) -> Path:
+    """Return the Parquet sidecar used to cache the parsed ``csv_path``."""
+    return csv_path.with_name(csv_path.name + ".parquet")
+
+
+def _read_cache(csv_path: Path) -> Optional[pd.DataFrame]:
+    """Return the cached events for ``csv_path`` if the cache is up to date."""
+    cache = _cache_path(csv_path)
+    if not cache.exists() or cache.stat().st_mtime < csv_path.stat().st_mtime:
+        return None
+    try:
+        return pd.read_parquet(cache)
+    except Exception:
+        # Missing Parquet engine or an unreadable cache: fall back to the CSV
+        return None
+
+
+def _write_cache(df: pd.DataFrame, csv_path: Path) -> None:
+    """Cache parsed events next to ``csv_path``; caching is best effort."""
+    try:
+        df.to_parquet(_cache_path(csv_path), compression="zstd")
+    except Exception as exc:
+        logging.debug(f"Not caching parsed events: {exc}")
+
+
+def _count_by_severity(label_codes: np.ndarray, n_labels: int,
+                       severity: pd.Series) -> np.ndarray:
+    """Count rows per (label, severity) pair as an ``(n_labels, 3)`` array.
+
+    Every pair maps to its own bin of a flat array, so all pairs are counted
+    in a single ``bincount`` pass.  Rows with a missing label (code -1) or an
+    unknown severity are skipped.
+    """
+    severity_codes = _as_severity(severity).cat.codes.to_numpy()
+    valid = (label_codes >= 0) & (severity_codes >= 0)
+    n_severities = len(SEVERITIES)
+    bins = label_codes[valid].astype(np.int64) * n_severities + severity_codes[valid]
+    counts = np.bincount(bins, minlength=n_labels * n_severities)
+    return counts.reshape(n_labels, n_severities)
+
+
 def generate_summary(df: pd.DataFrame) -> pd.DataFrame:
-    """Compute counts by event type and severity as a pivot table.
+    """Compute counts by event type and severity.
 
-    This function creates a pivot table with event types as the index and
+    This function creates a table with event types as the index and
     severity labels as columns.  Missing severity columns are filled with zero
     counts to simplify downstream charting and printing.
     """
-    summary = df.pivot_table(index="event_type",
-                             columns="severity",
-                             values="timestamp",
-                             aggfunc="count",
-                             fill_value=0)
-    severities = ["low", "medium", "high"]
-    for sev in severities:
-        if sev not in summary.columns:
-            summary[sev] = 0
-    return summary[severities]
+    event_type = df["event_type"]
+    if not isinstance(event_type.dtype, pd.CategoricalDtype):
+        event_type = event_type.astype("category")
+    categories = event_type.cat.categories
+    counts = _count_by_severity(event_type.cat.codes.to_numpy(), len(categories), df["severity"])
+    return pd.DataFrame(counts,
+                        index=pd.Index(categories, name="event_type"),
+                        columns=pd.Index(SEVERITIES, name="severity"))
 
 
 def compute_daily_summary(df: pd.DataFrame) -> pd.DataFrame:
@@ -115,31 +231,184 @@ def compute_daily_summary(df: pd.DataFrame) -> pd.DataFrame:
     """
     if "timestamp" not in df.columns:
         raise ValueError("DataFrame must contain a 'timestamp' column")
-    daily_df = df.copy()
-    daily_df["date"] = daily_df["timestamp"].dt.date
-    daily = daily_df.pivot_table(index="date",
-                                 columns="severity",
-                                 values="timestamp",
-                                 aggfunc="count",
-                                 fill_value=0)
-    severities = ["low", "medium", "high"]
-    for sev in severities:
-        if sev not in daily.columns:
-            daily[sev] = 0
-    return daily[severities]
-
-
-def top_high_severity_ips(df: pd.DataFrame, top_n: int = 5) -> pd.Series:
+    date = df["timestamp"].dt.floor("D").rename("date")
+    severity = _severity_key(df["severity"])
+    return _unstack_severity(df.groupby([date, severity], observed=True).size())
+
+
+def generate_summaries(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Return ``(generate_summary(df), compute_daily_summary(df))`` in one pass.
+
+    Every row is counted once into a dense (event type, day, severity) array,
+    and both summaries are its sums over days and over event types.  Rows
+    with a missing type or day get an extra slot so that each summary still
+    counts them exactly as the single-purpose functions do.  When that array
+    would be larger than the data itself, the two summaries are computed
+    separately instead.
+    """
+    if "timestamp" not in df.columns:
+        raise ValueError("DataFrame must contain a 'timestamp' column")
+    event_type = df["event_type"]
+    if not isinstance(event_type.dtype, pd.CategoricalDtype):
+        event_type = event_type.astype("category")
+    day_codes, days = pd.factorize(df["timestamp"].dt.floor("D"), sort=True)
+    n_types, n_days = len(event_type.cat.categories), len(days)
+    if (n_types + 1) * (n_days + 1) > len(df):
+        return generate_summary(df), compute_daily_summary(df)
+    event_codes = event_type.cat.codes.to_numpy().astype(np.int64)
+    event_codes[event_codes < 0] = n_types
+    day_codes = np.where(day_codes < 0, n_days, day_codes)
+    counts = _count_by_severity(event_codes * (n_days + 1) + day_codes,
+                                (n_types + 1) * (n_days + 1), df["severity"])
+    counts = counts.reshape(n_types + 1, n_days + 1, len(SEVERITIES))
+    type_counts = counts[:n_types].sum(axis=1)
+    day_counts = counts[:, :n_days].sum(axis=0)
+    severity_columns = pd.Index(SEVERITIES, name="severity")
+    summary = pd.DataFrame(type_counts, columns=severity_columns,
+                           index=pd.Index(event_type.cat.categories, name="event_type"))
+    daily = pd.DataFrame(day_counts, columns=severity_columns, index=days.rename("date"))
+    return summary, daily
+
+
+def load_and_summarize(source: str | Path,
+                       chunksize: int = 2_000_000) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Stream a CSV in chunks and return the type and daily summaries.
+
+    This produces the same tables as ``generate_summary`` and
+    ``compute_daily_summary`` without holding the whole log in memory: each
+    chunk of ``chunksize`` rows is reduced to counts per key, and the counts
+    are added across chunks.  Peak memory is bounded by the chunk size plus
+    the number of distinct (type, severity) and (date, severity) keys.  As
+    when the whole column is parsed at once, the timestamp format is inferred
+    from the first timestamp that is not a placeholder such as ``NaT`` or
+    ``now``, and then used for every chunk.
+
+    Parameters
+    ----------
+    source : str or Path
+        Path to a CSV file or ``-`` to read from ``sys.stdin``.
+    chunksize : int
+        Number of rows parsed per chunk.
+
+    Returns
+    -------
+    tuple of pandas.DataFrame
+        ``(summary, daily)`` tables with low/medium/high severity columns.
+
+    Raises
+    ------
+    FileNotFoundError
+        If ``source`` is a path and the file does not exist.
+    ValueError
+        If the required columns are missing from the CSV.
+    """
+    if source == "-":
+        logging.info("Reading event data from STDIN in chunks…")
+        handle = sys.stdin
+        usecols = _is_event_column
+    else:
+        handle = Path(source)
+        if not handle.exists():
+            raise FileNotFoundError(f"Input CSV does not exist: {handle}")
+        usecols = _columns_to_read(handle)
+
+    summary_counts: Optional[pd.Series] = None
+    daily_counts: Optional[pd.Series] = None
+    timestamp_format: Optional[str] = None
+    with pd.read_csv(handle, chunksize=chunksize, usecols=usecols, dtype=CSV_DTYPES) as reader:
+        for chunk in reader:
+            missing = REQUIRED_COLUMNS - set(chunk.columns)
+            if missing:
+                raise ValueError(f"Missing required columns in input CSV: {missing}")
+            timestamps = chunk["timestamp"]
+            if timestamp_format is None:
+                first = _first_timestamp(timestamps)
+                if first is not None:
+                    # "mixed" parses each value on its own, as pandas does for
+                    # a column whose first timestamp matches no known format
+                    timestamp_format = guess_datetime_format(first) or "mixed"
+            date = (pd.to_datetime(timestamps, format=timestamp_format, errors="coerce")
+                      .dt.floor("D").rename("date"))
+            severity = _severity_key(chunk["severity"])
+            counts = chunk.groupby(["event_type", severity], observed=True).size()
+            daily = chunk.groupby([date, severity], observed=True).size()
+            if summary_counts is None:
+                summary_counts, daily_counts = counts, daily
+            else:
+                summary_counts = summary_counts.add(counts, fill_value=0)
+                daily_counts = daily_counts.add(daily, fill_value=0)
+    if summary_counts is None:
+        raise ValueError("Input CSV contains no rows")
+    # Each chunk has its own event type categories, so restore their order
+    summary = _unstack_severity(summary_counts).sort_index()
+    return summary, _unstack_severity(daily_counts)
+
+
+def _first_timestamp(timestamps: pd.Series) -> Optional[str]:
+    """Return the timestamp pandas would guess the column's format from."""
+    for value in timestamps.dropna():
+        if str(value) not in TIMESTAMP_PLACEHOLDERS:
+            return str(value)
+    return None
+
+
+def _severity_key(severity: pd.Series) -> pd.Series:
+    """Return ``severity`` as a groupby key that keeps every row.
+
+    Labels outside low/medium/high are grouped as ``"other"`` rather than
+    dropped, so a day whose events all have an unrecognised severity still
+    gets a row of zeros once ``_unstack_severity`` keeps the known columns.
+    """
+    return _as_severity(severity).cat.add_categories("other").fillna("other")
+
+
+def _unstack_severity(counts: pd.Series) -> pd.DataFrame:
+    """Turn (key, severity) counts into a table with one column per severity."""
+    return (counts.astype("int64")
+                  .unstack("severity", fill_value=0)
+                  .reindex(columns=SEVERITIES, fill_value=0))
+
+
+def high_severity_events(df: pd.DataFrame) -> pd.DataFrame:
+    """Return the high severity rows of ``df``.
+
+    The filter reuses the ``is_high`` mask precomputed by ``load_events``.
+    Callers that need several high severity views (such as the interactive
+    menu) compute this once and pass it to the functions below as ``high_df``.
+    """
+    if "severity" not in df.columns:
+        raise ValueError("DataFrame must contain a 'severity' column")
+    return df[_high_mask(df)]
+
+
+def top_high_severity_ips(df: pd.DataFrame, top_n: int = 5,
+                          high_df: Optional[pd.DataFrame] = None) -> pd.Series:
     """Return the top ``top_n`` IP addresses among high severity events.
 
     The input DataFrame must contain ``severity`` and ``ip`` columns.  The
     ``severity`` values are compared case‑insensitively to the string
-    "high".
+    "high".  ``high_df`` may be a precomputed ``high_severity_events(df)``.
     """
     if "severity" not in df.columns or "ip" not in df.columns:
         raise ValueError("DataFrame must contain 'severity' and 'ip' columns")
-    high_df = df[df["severity"].str.lower() == "high"]
-    return high_df["ip"].value_counts().head(top_n)
+    if high_df is None:
+        high_df = high_severity_events(df)
+    ips = high_df["ip"]
+    if not isinstance(ips.dtype, pd.CategoricalDtype):
+        # Sorted categories, as read_csv gives, so ties break the same way
+        ips = ips.astype("category")
+    # Count per category code and partially sort: only the top_n IPs are
+    # ordered, not every distinct IP.
+    codes = ips.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(ips.cat.categories))
+    k = min(top_n, np.count_nonzero(counts))
+    if k <= 0:
+        return pd.Series([], index=pd.Index([], name="ip"), name="count", dtype="int64")
+    # Ties are broken by category order so the selection is deterministic
+    rank = counts * len(counts) - np.arange(len(counts))
+    top = np.argpartition(-rank, k - 1)[:k]
+    top = top[np.argsort(-rank[top])]
+    return pd.Series(counts[top], index=pd.Index(ips.cat.categories[top], name="ip"), name="count")
 
 
 def correlate_by_ip_and_type(df: pd.DataFrame) -> pd.DataFrame:
@@ -147,51 +416,78 @@ def correlate_by_ip_and_type(df: pd.DataFrame) -> pd.DataFrame:
 
     This helper groups events first by IP address and then by their type to
     reveal which IPs are associated with which kinds of incidents.  The
-    returned pivot table has IP addresses on the index and event types as
+    returned table has IP addresses on the index and event types as
     columns with counts for each.
     """
     if "ip" not in df.columns:
         raise ValueError("DataFrame must contain an 'ip' column for correlation")
-    return df.pivot_table(index="ip", columns="event_type", values="timestamp",
-                          aggfunc="count", fill_value=0)
+    return (df.groupby(["ip", "event_type"], observed=True)
+              .size()
+              .unstack("event_type", fill_value=0))
 
 
-def correlate_high_severity_by_ip(df: pd.DataFrame) -> pd.DataFrame:
+def correlate_high_severity_by_ip(df: pd.DataFrame,
+                                  high_df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """Focus the correlation on high and critical severity events by IP.
 
     Filters to rows where severity is high (case‑insensitive) and then
-    produces a pivot table with IPs and event types.  If there are no high
-    severity events, an empty DataFrame is returned.
+    produces a table with IPs and event types.  If there are no high
+    severity events, an empty DataFrame is returned.  ``high_df`` may be a
+    precomputed ``high_severity_events(df)``.
     """
     if "severity" not in df.columns or "ip" not in df.columns:
         raise ValueError("DataFrame must contain 'severity' and 'ip' columns")
-    high_df = df[df["severity"].str.lower() == "high"].copy()
+    if high_df is None:
+        high_df = high_severity_events(df)
     if high_df.empty:
         return pd.DataFrame()
-    return high_df.pivot_table(index="ip", columns="event_type", values="timestamp",
-                               aggfunc="count", fill_value=0)
+    return (high_df.groupby(["ip", "event_type"], observed=True)
+                   .size()
+                   .unstack("event_type", fill_value=0))
 
 
 def plot_summary(summary: pd.DataFrame, output_path: Path, title: str) -> None:
-    """Render a grouped bar chart for a pivot table summarising events.
+    """Render a grouped bar chart for a table summarising events.
 
     Each severity column becomes a separate bar series.  The resulting figure
     is saved to the provided ``output_path``.  The plot is closed after
     saving to free memory when processing large datasets.
     """
-    plt.figure(figsize=(10, 6))
-    import numpy as np
+    # matplotlib is imported on first use so that --help, input errors and
+    # table-only runs don't pay for it.  Figures are built directly rather
+    # than through pyplot: charts are only written to files (no GUI backend
+    # is needed) and pyplot's global figure registry is not thread-safe.
+    from matplotlib.collections import PolyCollection
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(10, 6))
+    ax = fig.add_subplot()
+    # Generate bar positions
     x = np.arange(len(summary.index))
+    values = summary.to_numpy()
     width = 0.25
+    many_bars = len(x) > MAX_XTICKS
     for i, sev in enumerate(summary.columns):
-        plt.bar(x + i * width - width, summary[sev], width=width, label=sev.capitalize())
-    plt.xticks(x, summary.index, rotation=30, ha='right')
-    plt.ylabel("Number of events")
-    plt.title(title)
-    plt.legend(title="Severity")
-    plt.tight_layout()
-    plt.savefig(output_path)
-    plt.close()
+        # One collection per severity rather than a Rectangle artist per bar;
+        # vertices run (left, 0) -> (left, h) -> (right, h) -> (right, 0).
+        left = x + (i - 1) * width - width / 2
+        verts = np.empty((len(x), 4, 2))
+        verts[:, :, 0] = left[:, None] + np.array([0, 0, width, width])
+        verts[:, :, 1] = values[:, i, None] * np.array([0, 1, 1, 0])
+        bars = PolyCollection(verts, facecolors=f"C{i}", label=sev.capitalize(),
+                              rasterized=many_bars)
+        bars.sticky_edges.y.append(0)
+        ax.add_collection(bars)
+    ax.autoscale_view()
+    step = -(-len(x) // MAX_XTICKS) if many_bars else 1
+    ax.set_xticks(x[::step])
+    # astype(str) renders midnight timestamps of daily summaries as plain dates
+    ax.set_xticklabels(summary.index[::step].astype(str), rotation=30, ha='right')
+    ax.set_ylabel("Number of events")
+    ax.set_title(title)
+    ax.legend(title="Severity")
+    fig.tight_layout()
+    fig.savefig(output_path)
 
 
 def print_table(df: pd.DataFrame, title: str) -> None:
@@ -206,7 +502,19 @@ def interactive_menu(df: pd.DataFrame) -> None:
 
     Users can choose to view summaries, daily breakdowns, top IPs or
     correlation tables.  The menu loops until the user chooses to exit.
+    ``df`` does not change during the session, so each table is computed the
+    first time it is requested and reused afterwards.
     """
+    tables: Dict[str, pd.DataFrame] = {}
+
+    def table(name: str, compute: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        if name not in tables:
+            tables[name] = compute()
+        return tables[name]
+
+    def high_df() -> pd.DataFrame:
+        return table("high", lambda: high_severity_events(df))
+
     while True:
         print("\nIncident Dashboard Interactive Menu:")
         print("1. View summary by type and severity")
@@ -217,10 +525,10 @@ def interactive_menu(df: pd.DataFrame) -> None:
         print("6. Exit menu")
         choice = input("Select an option (1‑6): ").strip()
         if choice == "1":
-            summary = generate_summary(df)
+            summary = table("summary", lambda: generate_summary(df))
             print_table(summary, "Summary by type and severity:")
         elif choice == "2":
-            daily = compute_daily_summary(df)
+            daily = table("daily", lambda: compute_daily_summary(df))
             print_table(daily, "Daily summary by severity:")
         elif choice == "3":
             try:
@@ -228,15 +536,15 @@ def interactive_menu(df: pd.DataFrame) -> None:
             except ValueError:
                 print("Invalid number; defaulting to 5.")
                 n = 5
-            ips = top_high_severity_ips(df, n)
+            ips = top_high_severity_ips(df, n, high_df=high_df())
             print("Top IP addresses with high severity events:")
             for ip, count in ips.items():
                 print(f"  {ip}: {count}")
         elif choice == "4":
-            corr = correlate_by_ip_and_type(df)
+            corr = table("corr", lambda: correlate_by_ip_and_type(df))
             print_table(corr, "Correlation of incidents by IP and event type:")
         elif choice == "5":
-            high_corr = correlate_high_severity_by_ip(df)
+            high_corr = table("high_corr", lambda: correlate_high_severity_by_ip(df, high_df=high_df()))
             if high_corr.empty:
                 print("No high severity events to correlate.")
             else:
@@ -248,7 +556,7 @@ def interactive_menu(df: pd.DataFrame) -> None:
             print("Invalid selection; please choose a number between 1 and 6.")
 
 
-def parse_args(args: Iterable[str]) -> argparse.Namespace:
+def parse_args(args: list[str]) -> argparse.Namespace:
     """Define and parse command‑line arguments for the dashboard."""
     parser = argparse.ArgumentParser(
         description=(
@@ -286,45 +594,85 @@ def parse_args(args: Iterable[str]) -> argparse.Namespace:
         action="store_true",
         help="Launch an interactive menu instead of producing static output.",
     )
-    return parser.parse_args(list(args))
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help=(
+            "Stream the input in chunks of this many rows to bound memory use. "
+            "Only the summary and daily charts are produced in this mode."
+        ),
+    )
+    parsed = parser.parse_args(args)
+    if parsed.chunksize is not None:
+        if parsed.chunksize <= 0:
+            parser.error("--chunksize must be a positive number of rows")
+        if parsed.interactive or parsed.top_high > 0:
+            parser.error("--chunksize cannot be combined with --interactive or --top-high")
+    return parsed
 
 
-def main(argv: Optional[Iterable[str]] = None) -> None:
+def _report_plot(plot: Future, description: str, output_path: Path) -> None:
+    """Wait for a chart rendered by ``main`` and report where it was saved."""
+    try:
+        plot.result()
+        print(f"{description} chart saved to {output_path}")
+    except Exception as exc:
+        logging.error(f"Failed to save {description.lower()} plot: {exc}")
+
+
+def main(argv: Optional[list[str]] = None) -> None:
     """Entry point for running the dashboard as a script."""
     args = parse_args(argv if argv is not None else sys.argv[1:])
+    daily = None
     try:
-        df = load_events(args.input_csv)
+        if args.chunksize:
+            # Streaming mode: only the count tables are kept in memory
+            summary, daily = load_and_summarize(args.input_csv, args.chunksize)
+        else:
+            df = load_events(args.input_csv)
     except Exception as exc:
         logging.error(f"Failed to load events: {exc}")
         sys.exit(1)
     if args.interactive:
         interactive_menu(df)
         return
-    # Non‑interactive behaviour: generate summary and optional plots
-    summary = generate_summary(df)
-    print_table(summary, "Summary by type and severity:")
-    try:
-        plot_summary(summary, args.output_png, title="Incident Summary by Type and Severity")
-        print(f"Summary chart saved to {args.output_png}")
-    except Exception as exc:
-        logging.error(f"Failed to save summary plot: {exc}")
-    # Optional daily chart
-    if args.daily_output:
-        try:
-            daily = compute_daily_summary(df)
-            plot_summary(daily, args.daily_output, title="Daily Incident Counts by Severity")
-            print(f"Daily summary chart saved to {args.daily_output}")
-        except Exception as exc:
-            logging.error(f"Failed to save daily summary plot: {exc}")
-    # Optional top high severity IPs
-    if args.top_high > 0:
-        try:
-            ips = top_high_severity_ips(df, args.top_high)
-            print(f"Top {args.top_high} IP addresses with high severity events:")
-            for ip, count in ips.items():
-                print(f"  {ip}: {count}")
-        except Exception as exc:
-            logging.error(f"Failed to compute top IPs: {exc}")
+    # Non‑interactive behaviour: generate summary and optional plots.  The
+    # count tables are built first; the charts then render on worker threads
+    # (PNG encoding releases the GIL) alongside each other and the top IP list.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        if not args.chunksize:
+            if args.daily_output:
+                # Both tables are counted in a single pass over the events
+                try:
+                    summary, daily = generate_summaries(df)
+                except Exception as exc:
+                    logging.error(f"Failed to save daily summary plot: {exc}")
+            if daily is None:
+                summary = generate_summary(df)
+        print_table(summary, "Summary by type and severity:")
+        summary_plot = executor.submit(plot_summary, summary, args.output_png,
+                                       title="Incident Summary by Type and Severity")
+        # Optional daily chart
+        daily_plot = None
+        if args.daily_output and daily is not None:
+            try:
+                daily_plot = executor.submit(plot_summary, daily, args.daily_output,
+                                             title="Daily Incident Counts by Severity")
+            except Exception as exc:
+                logging.error(f"Failed to save daily summary plot: {exc}")
+        # Optional top high severity IPs
+        if args.top_high > 0:
+            try:
+                ips = top_high_severity_ips(df, args.top_high)
+                print(f"Top {args.top_high} IP addresses with high severity events:")
+                for ip, count in ips.items():
+                    print(f"  {ip}: {count}")
+            except Exception as exc:
+                logging.error(f"Failed to compute top IPs: {exc}")
+        _report_plot(summary_plot, "Summary", args.output_png)
+        if daily_plot is not None:
+            _report_plot(daily_plot, "Daily summary", args.daily_output)
 
 
 if __name__ == "__main__":
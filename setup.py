@@ -8,7 +8,11 @@ setup(
         "correlation analysis and interactive exploration"
     ),
     py_modules=["incident_dashboard_v2", "incident_dashboard_v3"],
-    install_requires=["pandas", "matplotlib", "numpy"],
+    install_requires=["pandas>=2.2", "matplotlib", "numpy"],
+    extras_require={
+        # Parquet engine for the parsed-events cache written next to CSV inputs
+        "cache": ["pyarrow"],
+    },
     entry_points={
         "console_scripts": [
             # Bind the CLI entry point to v3 by default for advanced features
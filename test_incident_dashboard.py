@@ -1,17 +1,29 @@
 """
-Unit tests for the incident_dashboard module.
+Unit tests for the incident_dashboard, incident_dashboard_v2 and
+incident_dashboard_v3 modules.
 
-These tests exercise the high-level functions used by the dashboard script.
-They ensure that input validation occurs and that summary tables are
-generated correctly.
+These tests exercise the high-level functions used by the dashboard scripts.
+They ensure that input validation occurs, that summary and correlation tables
+are generated correctly and that charts are rendered.
 """
 from pathlib import Path
+from matplotlib.figure import Figure
+import numpy as np
 import pandas as pd
 import pytest
 
 import incident_dashboard as dash
+import incident_dashboard_v2 as dash_v2
+import incident_dashboard_v3 as dash_v3
 
 
+@pytest.fixture
+def sample_csv(tmp_path: Path) -> Path:
+    """Copy of the sample log, so v3's Parquet sidecar is written to ``tmp_path``."""
+    csv_path = tmp_path / "events.csv"
+    csv_path.write_bytes(Path(__file__).with_name("sample_logs.csv").read_bytes())
+    return csv_path
+
 
 def test_load_events_missing_file(tmp_path: Path) -> None:
     """Loading a non-existent file should raise FileNotFoundError."""
@@ -33,7 +45,9 @@ def test_generate_summary_counts() -> None:
     """Verify that summary counts match the expected values for the sample dataset."""
     df = pd.read_csv(Path(__file__).with_name("sample_logs.csv"))
     df["timestamp"] = pd.to_datetime(df["timestamp"])
-    summary = dash.generate_summary(df)
+    result = dash.generate_summary(df)
+    assert result.counts.shape == (5, 3)
+    summary = result.to_frame()
     # Ensure the summary contains the expected rows and columns
     assert set(summary.index) == {"Failed Login", "Phishing URL", "Port Scan", "Threat Intel", "Vulnerability"}
     assert list(summary.columns) == ["low", "medium", "high"]
@@ -41,3 +55,236 @@ def test_generate_summary_counts() -> None:
     assert summary.loc["Failed Login", "high"] == 1
     assert summary.loc["Phishing URL", "medium"] == 1
     assert summary.loc["Port Scan", "low"] == 1
+
+
+def test_generate_summary_from_loaded_events() -> None:
+    """Summaries of loaded (categorical) data keep the low/medium/high column order."""
+    df = dash.load_events(Path(__file__).with_name("sample_logs.csv"))
+    assert "description" not in df.columns
+    result = dash.generate_summary(df)
+    assert int(result.counts.sum()) == len(df)
+    summary = result.to_frame()
+    assert list(summary.columns) == ["low", "medium", "high"]
+    assert summary.loc["Vulnerability", "high"] == 2
+
+
+def test_load_and_summarize_matches_in_memory(sample_csv: Path) -> None:
+    """Chunked summaries should equal the summaries of the fully loaded frame."""
+    df = dash_v3.load_events(sample_csv)
+    summary, daily = dash_v3.load_and_summarize(sample_csv, chunksize=4)
+    pd.testing.assert_frame_equal(summary, dash_v3.generate_summary(df))
+    pd.testing.assert_frame_equal(daily, dash_v3.compute_daily_summary(df))
+
+
+def test_load_and_summarize_matches_in_memory_on_messy_rows(tmp_path: Path) -> None:
+    """Unknown severities, unparseable timestamps and mixed formats match too."""
+    csv_path = tmp_path / "messy.csv"
+    csv_path.write_text(
+        "timestamp,event_type,severity\n"
+        "2025-01-01T10:00:00,Port Scan,low\n"
+        "2025-01-01T11:00:00,Malware,critical\n"
+        "not a time,Port Scan,HIGH\n"
+        "2025-01-02T09:30:00,Phishing URL,unknown\n"
+        "01/02/2025,Port Scan,medium\n"
+        ",Malware,high\n"
+    )
+    df = dash_v3.load_events(csv_path)
+    summary, daily = dash_v3.load_and_summarize(csv_path, chunksize=2)
+    assert list(summary.index) == ["Malware", "Phishing URL", "Port Scan"]
+    pd.testing.assert_frame_equal(summary, dash_v3.generate_summary(df))
+    pd.testing.assert_frame_equal(daily, dash_v3.compute_daily_summary(df))
+
+
+@pytest.mark.parametrize("placeholder", ["NaT", "now"])
+def test_load_and_summarize_guesses_format_past_placeholders(tmp_path: Path, placeholder: str) -> None:
+    """Like pandas, chunked parsing guesses the format from the first real timestamp."""
+    csv_path = tmp_path / "placeholder.csv"
+    csv_path.write_text(
+        "timestamp,event_type,severity\n"
+        f"{placeholder},Port Scan,low\n"
+        "01/02/2025,Port Scan,low\n"
+        "13/02/2025,Malware,high\n"
+        "2025-03-01,Malware,high\n"
+    )
+    df = dash_v3.load_events(csv_path)
+    _, daily = dash_v3.load_and_summarize(csv_path, chunksize=2)
+    pd.testing.assert_frame_equal(daily, dash_v3.compute_daily_summary(df))
+    assert pd.Timestamp("2025-01-02") in daily.index
+    assert pd.Timestamp("2025-03-01") not in daily.index
+
+
+@pytest.fixture
+def mixed_events() -> pd.DataFrame:
+    """Events over a few days with mixed-case, unknown and missing values."""
+    rng = np.random.default_rng(0)
+    n = 500
+    df = pd.DataFrame({
+        "timestamp": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 5 * 86400, n), unit="s"),
+        "event_type": pd.Categorical(rng.choice(["Malware", "Phishing", "Vulnerability"], n)),
+        "severity": rng.choice(["low", "Medium", "HIGH", "unknown"], n),
+    })
+    df.loc[::50, "timestamp"] = pd.NaT
+    return df
+
+
+def test_generate_summaries_matches_separate_passes(mixed_events: pd.DataFrame) -> None:
+    """The single-pass summaries should equal the per-table functions."""
+    summary, daily = dash_v3.generate_summaries(mixed_events)
+    pd.testing.assert_frame_equal(summary, dash_v3.generate_summary(mixed_events))
+    pd.testing.assert_frame_equal(daily, dash_v3.compute_daily_summary(mixed_events))
+
+
+def test_generate_summaries_matches_separate_passes_v2(mixed_events: pd.DataFrame) -> None:
+    """v2's single-pass SummaryResults should equal its per-table functions."""
+    summary, daily = dash_v2.generate_summaries(mixed_events)
+    for combined, expected in [(summary, dash_v2.generate_summary(mixed_events)),
+                               (daily, dash_v2.compute_daily_summary(mixed_events))]:
+        assert combined.label_name == expected.label_name
+        assert list(combined.labels) == list(expected.labels)
+        assert (combined.counts == expected.counts).all()
+    assert len(daily.labels) == 5
+
+
+def test_load_events_reuses_parquet_cache(sample_csv: Path) -> None:
+    """A second load should come from the Parquet sidecar and match the CSV parse."""
+    pytest.importorskip("pyarrow")
+    first = dash_v3.load_events(sample_csv)
+    assert sample_csv.with_name("events.csv.parquet").exists()
+    second = dash_v3.load_events(sample_csv)
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_generate_summary_normalises_severity_case() -> None:
+    """Severity labels are matched case-insensitively; unknown labels are ignored."""
+    df = pd.DataFrame({
+        "timestamp": pd.to_datetime(["2025-01-01"] * 4),
+        "event_type": ["Port Scan"] * 4,
+        "severity": ["High", "HIGH", "low", "critical"],
+    })
+    summary = dash.generate_summary(df)
+    assert list(summary.labels) == ["Port Scan"]
+    assert summary.counts.tolist() == [[1, 0, 2]]
+
+
+def test_compute_daily_summary_keeps_days_with_unknown_severity() -> None:
+    """Days whose events all have unrecognised severities are listed with zeros."""
+    df = pd.DataFrame({
+        "timestamp": pd.to_datetime(["2025-01-01", "2025-01-02", "2025-01-02", None]),
+        "event_type": ["Malware", "Port Scan", "Port Scan", "Malware"],
+        "severity": ["critical", "High", "low", "low"],
+    })
+    daily = dash_v3.compute_daily_summary(df)
+    assert [str(day.date()) for day in daily.index] == ["2025-01-01", "2025-01-02"]
+    assert daily.to_numpy().tolist() == [[0, 0, 0], [1, 0, 1]]
+
+
+def test_top_high_severity_ips_only_reports_high_events(sample_csv: Path) -> None:
+    """Asking for more IPs than exist returns only IPs with high severity events."""
+    df = dash_v3.load_events(sample_csv)
+    ips = dash_v3.top_high_severity_ips(df, 50)
+    assert len(ips) == 6
+    assert (ips == 1).all()
+    assert list(dash_v3.top_high_severity_ips(df, 2).index) == list(ips.index[:2])
+
+
+def test_top_high_severity_ips_breaks_ties_by_ip(sample_csv: Path) -> None:
+    """Categorical and plain string IP columns rank tied IPs the same way."""
+    df = dash_v3.load_events(sample_csv)
+    plain = df.assign(ip=df["ip"].astype(str).where(df["ip"].notna()))
+    categorical_ips = dash_v3.top_high_severity_ips(df, 3)
+    assert categorical_ips.equals(dash_v3.top_high_severity_ips(plain, 3))
+    assert list(categorical_ips.index) == sorted(categorical_ips.index)
+
+
+def test_correlation_tables_count_sample_events(sample_csv: Path) -> None:
+    """IP x event type tables match a crosstab of the raw CSV."""
+    raw = pd.read_csv(sample_csv)
+    df = dash_v3.load_events(sample_csv)
+    high = raw[raw["severity"].str.lower() == "high"]
+    for table, rows in [(dash_v3.correlate_by_ip_and_type(df), raw),
+                        (dash_v3.correlate_high_severity_by_ip(df), high)]:
+        expected = pd.crosstab(rows["ip"], rows["event_type"])
+        # The tables are keyed by the loaded categoricals, crosstab by strings
+        pd.testing.assert_frame_equal(table, expected, check_index_type=False,
+                                      check_column_type=False, check_categorical=False)
+    assert int(dash_v3.correlate_high_severity_by_ip(df).to_numpy().sum()) == len(high) > 0
+
+
+def test_print_summary_orders_totals(capsys: pytest.CaptureFixture[str]) -> None:
+    """Event types are listed by descending total count."""
+    summary = dash.SummaryResult(np.array(["Port Scan", "Phishing URL"], dtype=object),
+                                 np.array([[1, 0, 0], [0, 2, 3]]))
+    dash.print_summary(summary)
+    out = capsys.readouterr().out
+    assert out.endswith("Top event types by total count:\n  Phishing URL: 5\n  Port Scan: 1\n")
+
+
+def test_print_summary_lists_top_types_of_wide_taxonomy(capsys: pytest.CaptureFixture[str]) -> None:
+    """Wide taxonomies only list the largest totals, ties in label order."""
+    n_types = dash.FULL_RANKING_MAX + 10
+    totals = np.arange(n_types) % 7
+    counts = np.zeros((n_types, 3), dtype=np.int64)
+    counts[:, 2] = totals
+    labels = np.array([f"type{i}" for i in range(n_types)], dtype=object)
+    dash.print_summary(dash.SummaryResult(labels, counts))
+    out = capsys.readouterr().out
+    listed = out.split(f"Top {dash.TOP_EVENT_TYPES} of {n_types} event types by total count:\n")[1]
+    order = np.argsort(-totals, kind="stable")[:dash.TOP_EVENT_TYPES]
+    assert listed == "".join(f"  type{i}: {totals[i]}\n" for i in order)
+
+
+@pytest.fixture
+def saved_figures(monkeypatch: pytest.MonkeyPatch) -> list[Figure]:
+    """Record every figure written with ``Figure.savefig``."""
+    saved = []
+    savefig = Figure.savefig
+
+    def record(fig: Figure, *args, **kwargs):
+        saved.append(fig)
+        return savefig(fig, *args, **kwargs)
+
+    monkeypatch.setattr(Figure, "savefig", record)
+    return saved
+
+
+def _check_chart(output_path: Path, saved_figures: list[Figure], n_labels: int) -> None:
+    """The chart was written and labels at most ``MAX_XTICKS`` bars."""
+    assert output_path.stat().st_size > 0
+    [fig] = saved_figures
+    tick_labels = fig.axes[0].get_xticklabels()
+    if n_labels <= dash.MAX_XTICKS:
+        assert len(tick_labels) == n_labels
+    else:
+        assert 0 < len(tick_labels) <= dash.MAX_XTICKS
+
+
+@pytest.mark.parametrize("n_labels", [3, 4 * dash.MAX_XTICKS + 1])
+def test_plot_summary_renders_png(tmp_path: Path, saved_figures: list[Figure], n_labels: int) -> None:
+    """v1 charts narrow and wide taxonomies."""
+    labels = np.array([f"type{i}" for i in range(n_labels)], dtype=object)
+    counts = np.arange(3 * n_labels).reshape(n_labels, 3)
+    output_path = tmp_path / "summary.png"
+    dash.plot_summary(dash.SummaryResult(labels, counts), output_path)
+    _check_chart(output_path, saved_figures, n_labels)
+
+
+@pytest.mark.parametrize("n_labels", [3, 4 * dash_v2.MAX_XTICKS + 1])
+def test_plot_summary_renders_png_v2(tmp_path: Path, saved_figures: list[Figure], n_labels: int) -> None:
+    """v2 charts narrow summaries and a long daily summary."""
+    labels = pd.date_range("2025-01-01", periods=n_labels).strftime("%Y-%m-%d").to_numpy()
+    counts = np.arange(3 * n_labels).reshape(n_labels, 3)
+    output_path = tmp_path / "daily.png"
+    dash_v2.plot_summary(dash_v2.SummaryResult(labels, counts, label_name="date"), output_path,
+                         title="Daily Incident Counts by Severity")
+    _check_chart(output_path, saved_figures, n_labels)
+
+
+@pytest.mark.parametrize("n_labels", [3, 4 * dash_v3.MAX_XTICKS + 1])
+def test_plot_summary_renders_png_v3(tmp_path: Path, saved_figures: list[Figure], n_labels: int) -> None:
+    """v3 charts narrow summaries and a long daily summary."""
+    summary = pd.DataFrame(np.arange(3 * n_labels).reshape(n_labels, 3),
+                           index=pd.date_range("2025-01-01", periods=n_labels, name="date"),
+                           columns=pd.Index(["low", "medium", "high"], name="severity"))
+    output_path = tmp_path / "daily.png"
+    dash_v3.plot_summary(summary, output_path, title="Daily Incident Counts by Severity")
+    _check_chart(output_path, saved_figures, n_labels)